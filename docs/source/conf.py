@@ -3,11 +3,6 @@
 # For the full list of built-in configuration values, see the documentation:
 # https://www.sphinx-doc.org/en/master/usage/configuration.html
 
-import os
-import sys
-
-sys.path.insert(0, os.path.abspath("../.."))  # Source code dir relative to this file
-
 # -- Project information -----------------------------------------------------
 # https://www.sphinx-doc.org/en/master/usage/configuration.html#project-information
 
@@ -20,9 +15,8 @@ release = "0.1.0"
 # https://www.sphinx-doc.org/en/master/usage/configuration.html#general-configuration
 
 extensions = [
-    "sphinx.ext.autodoc",
+    "autoapi.extension",
     "sphinx.ext.coverage",
-    "sphinx_autodoc_typehints",
     "sphinx_markdown_builder",
     "sphinx_rtd_theme",
 ]
@@ -31,3 +25,21 @@ templates_path = ["_templates"]
 exclude_patterns = []
 
 html_theme = "sphinx_rtd_theme"
+
+# Render type hints in the parameter descriptions, as plain short names.
+autodoc_typehints = "description"
+autodoc_typehints_format = "short"
+
+# -- AutoAPI -----------------------------------------------------------------
+# https://sphinx-autoapi.readthedocs.io/en/latest/reference/config.html
+#
+# AutoAPI parses the source files instead of importing them, so building the
+# docs never loads the driver DLLs.
+
+autoapi_type = "python"
+autoapi_dirs = ["../../i2cpy"]
+autoapi_ignore = ["*/driver/*"]  # Only the I2C class is documented.
+autoapi_generate_api_docs = False
+
+# i2cpy imports from the ignored driver package.
+suppress_warnings = ["autoapi.python_import_resolution"]
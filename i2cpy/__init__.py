@@ -47,26 +47,78 @@ wrapper functions youself. For example,
 from __future__ import annotations
 
 import os
-import logging
 from importlib import import_module
-from typing import List, Optional
+from importlib.util import find_spec
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
 
-try:
-    from collections.abc import Buffer
-except ImportError:
+if TYPE_CHECKING:
     from typing_extensions import Buffer
 
-from i2cpy.driver.abc import memaddr_to_bytes
+from i2cpy.driver.abc import I2CDriverBase, memaddr_to_bytes
 from i2cpy.errors import I2CInvalidDriverError
 
 
 from i2cpy._version import __version__  # noqa: F401
 
+# Driver used when I2C() is not given one.
+_DEFAULT_DRIVER = (os.getenv("I2CPY_DRIVER") or "ch341").lower()
 
-log = logging.getLogger(__name__)
+# Driver modules already resolved, keyed by driver name.
+_DRIVER_CACHE: Dict[str, ModuleType] = {}
+
+
+def _load_driver_module(driver_name: str) -> ModuleType:
+    module = _DRIVER_CACHE.get(driver_name)
+    if module is None:
+        try:
+            module = import_module("i2cpy.driver.{}".format(driver_name))
+        except (ModuleNotFoundError, ImportError) as exc:
+            raise I2CInvalidDriverError(driver_name) from exc
+        _DRIVER_CACHE[driver_name] = module
+    return module
+
+
+def _check_driver_module(driver_name: str):
+    """Make sure a driver module exists, without importing it."""
+    if driver_name in _DRIVER_CACHE:
+        return
+    try:
+        spec = find_spec("i2cpy.driver.{}".format(driver_name))
+    except (ModuleNotFoundError, ImportError, ValueError) as exc:
+        raise I2CInvalidDriverError(driver_name) from exc
+    if spec is None:
+        raise I2CInvalidDriverError(driver_name)
+
+
+class _DriverLoader:
+    """Placeholder for the driver of an `I2C` object until the driver is
+    created. Bus operations call methods on `I2C._driver` without checking
+    it, and the first of them goes through here to create the driver.
+    """
+
+    __slots__ = ("i2c",)
+
+    def __init__(self, i2c: I2C):
+        self.i2c = i2c
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.i2c.driver, name)
 
 
 class I2C:
+    __slots__ = (
+        "index",
+        "baudrate",
+        "driver_name",
+        "_driver",
+        "_driver_kwargs",
+        "_auto_init",
+    )
+
+    # Addresses probed by a default scan(), 0x08 to 0x77 inclusive.
+    _DEFAULT_SCAN_ADDRS = tuple(range(0x08, 0x78))
+
     def __init__(
         self,
         id: Optional[int | str] = None,
@@ -84,31 +136,54 @@ class I2C:
         :param driver: I2C driver name. It corresponds to the I2C driver sub
             module name shipped with this library. For example "foo" means module
             "i2cpy.driver.foo".
-            If not specified, it looks at environment variable "I2CPY_DRIVER".
+            If not specified, it looks at environment variable "I2CPY_DRIVER",
+            as set when i2cpy is imported.
             And if that's not defined or empty, it finally falls back to "ch341".
-        :param auto_init: Call `init()` on object initialization, defaults to True
+        :param auto_init: Call `init()` on object initialization, defaults to True.
+            The driver module is only imported, and the bus only initialized,
+            on first access to the bus.
         """
         self.index = id
         self.baudrate = freq
-        self.driver_name = (driver or os.getenv("I2CPY_DRIVER") or "ch341").lower()
-        driver_module_name = "i2cpy.driver.{}".format(self.driver_name)
-        try:
-            self.driver_module = import_module(driver_module_name)
-        except (ModuleNotFoundError, ImportError) as exc:
-            raise I2CInvalidDriverError(self.driver_name) from exc
-
-        self.driver = self.driver_module.driver_class()(id=id, freq=freq, **kwargs)
-
-        if auto_init:
-            self.init()
+        self.driver_name = driver.lower() if driver else _DEFAULT_DRIVER
+        _check_driver_module(self.driver_name)
+
+        self._driver: I2CDriverBase | _DriverLoader = _DriverLoader(self)
+        self._driver_kwargs: Dict[str, Any] = dict(kwargs, id=id, freq=freq)
+        self._auto_init = auto_init
+
+    @property
+    def driver_module(self) -> ModuleType:
+        """The driver module, imported on first access."""
+        return _load_driver_module(self.driver_name)
+
+    @property
+    def driver(self) -> I2CDriverBase:
+        """The driver instance, created on first access."""
+        driver = self._driver
+        if isinstance(driver, _DriverLoader):
+            driver_class = self.driver_module.driver_class()
+            driver = driver_class(**self._driver_kwargs)
+            if self._auto_init:
+                driver.init()
+            # Only kept once initialized, so that a failed init() is retried,
+            # and reported again, on the next bus access.
+            self._driver = driver
+        return driver
 
     def init(self):
         """Initialize the I2C bus."""
+        # An explicit init() takes over any still pending automatic one.
+        self._auto_init = False
         self.driver.init()
 
     def deinit(self):
         """Close the I2C bus."""
-        self.driver.deinit()
+        if isinstance(self._driver, _DriverLoader):
+            # Never touched the bus, so there is nothing to close.
+            self._auto_init = False
+            return
+        self._driver.deinit()
 
     def readfrom(self, addr: int, nbytes: int, /) -> bytes:
         """Read nbytes from the peripheral specified by addr.
@@ -117,16 +192,16 @@ class I2C:
         :param nbytes: number of bytes to read
         :return: the bytes read
         """
-        return self.driver.readfrom(addr, nbytes)
+        return self._driver.readfrom(addr, nbytes)
 
-    def readfrom_into(self, addr: int, buf: bytearray, /):
+    def readfrom_into(self, addr: int, buf: Buffer, /):
         """Read into buf from the peripheral specified by addr.
         The number of bytes read will be the length of buf.
 
         :param addr: I2C peripheral device address
-        :param buf: buffer to store the bytes read
+        :param buf: writable buffer to store the bytes read
         """
-        return self.driver.readfrom_into(addr, buf)
+        return self._driver.readfrom_into(addr, buf)
 
     def writeto(self, addr: int, buf: Buffer, /):
         """Write the bytes from buf to the peripheral specified by addr.
@@ -134,13 +209,52 @@ class I2C:
         :param addr: I2C peripheral deivce address
         :param buf: bytes to write
         """
-        return self.driver.writeto(addr, buf)
+        return self._driver.writeto(addr, buf)
+
+    def writevto(self, addr: int, vector: Sequence[Buffer], /):
+        """Write the bytes contained in vector to the peripheral specified by
+        addr. The buffers in vector are sent back to back in one transaction.
+
+        :param addr: I2C peripheral device address
+        :param vector: a sequence of buffers to write
+        """
+        return self._driver.writevto(addr, vector)
+
+    def writeto_then_readfrom(self, addr: int, out_buf: Buffer, in_buf: Buffer, /):
+        """Write the bytes from out_buf to the peripheral specified by addr,
+        then read into in_buf from it, with a repeated START instead of a STOP
+        in between where the driver supports it. The number of bytes read will
+        be the length of in_buf.
+
+        :param addr: I2C peripheral device address
+        :param out_buf: bytes to write
+        :param in_buf: writable buffer to store the bytes read
+        """
+        return self._driver.writeto_then_readfrom(addr, out_buf, in_buf)
+
+    def exchange_batch(self, ops: Sequence[Tuple[int, Buffer, int]], /) -> List[bytes]:
+        """Run a batch of operations, in order. Each operation is a tuple
+        (addr, wbuf, nread): write wbuf to the peripheral at addr if wbuf is
+        not empty, then read nread bytes from it if nread is not 0. Where the
+        driver supports it, short operations are sent together in one USB
+        transaction.
+
+        Operations sent together are not checked for acknowledgement: a
+        peripheral that does not respond has its writes dropped silently, and
+        its reads return filler bytes (0xFF). Use `scan()` or the single
+        operation methods where that has to be detected.
+
+        :param ops: operations to run
+        :return: a list of the same length as ops, with the bytes read by each
+            operation.
+        """
+        return self._driver.exchange_batch(ops)
 
     def readfrom_mem_into(
         self,
         addr: int,
         memaddr: int,
-        buf: bytearray,
+        buf: Buffer,
         *,
         addrsize: int = 8,
     ):
@@ -150,10 +264,10 @@ class I2C:
 
         :param addr: I2C peripheral device address
         :param memaddr: memory address
-        :param buf: buffer to store the bytes read
+        :param buf: writable buffer to store the bytes read
         :param addrsize: _description_, defaults to 8
         """
-        return self.driver.readfrom_mem_into(addr, memaddr, buf, addrsize=addrsize)
+        return self._driver.readfrom_mem_into(addr, memaddr, buf, addrsize=addrsize)
 
     def readfrom_mem(
         self,
@@ -172,9 +286,28 @@ class I2C:
         :param addrsize: _description_, defaults to 8
         :return: the bytes read
         """
+        return bytes(self.readfrom_mem_mv(addr, memaddr, nbytes, addrsize=addrsize))
+
+    def readfrom_mem_mv(
+        self,
+        addr: int,
+        memaddr: int,
+        nbytes: int,
+        *,
+        addrsize: int = 8,
+    ) -> memoryview:
+        """Same as `readfrom_mem()`, but returns a read-only memoryview of the
+        buffer read into, instead of copying it to a new `bytes` object.
+
+        :param addr: I2C peripheral device address
+        :param memaddr: memory address
+        :param nbytes: number of bytes to read
+        :param addrsize: _description_, defaults to 8
+        :return: a read-only memoryview of the bytes read
+        """
         buf = bytearray(nbytes)
-        self.readfrom_mem_into(addr, memaddr, buf)
-        return bytes(buf)
+        self.readfrom_mem_into(addr, memaddr, buf, addrsize=addrsize)
+        return memoryview(buf).toreadonly()
 
     def writeto_mem(
         self,
@@ -185,15 +318,15 @@ class I2C:
         addrsize: int = 8,
     ):
         """Write buf to the peripheral specified by addr starting from the
-        memory address specified by memaddr.
+        memory address specified by memaddr. The memory address and buf are
+        sent in a single transaction.
 
         :param addr: I2C peripheral device address
         :param memaddr: memory address
         :param buf: bytes to write
         :param addrsize: _description_, defaults to 8
         """
-        wbuf = memaddr_to_bytes(memaddr, addrsize) + buf
-        self.writeto(addr, wbuf)
+        self._driver.writevto(addr, (memaddr_to_bytes(memaddr, addrsize), buf))
 
     def scan(self, start: int = 0x08, stop: int = 0x77) -> List[int]:
         """Scan all I2C addresses between `start` and `stop` inclusive
@@ -205,4 +338,10 @@ class I2C:
         :param stop: stop address, defaults to 0x77
         :return: a list of addresses that respond to scan
         """
-        return [a for a in range(start, stop + 1) if self.driver.check_device(a)]
+        addrs: Sequence[int]
+        if start == 0x08 and stop == 0x77:
+            addrs = self._DEFAULT_SCAN_ADDRS
+        else:
+            addrs = range(start, stop + 1)
+        acks = self._driver.check_devices(addrs)
+        return [a for a, ack in zip(addrs, acks) if ack]
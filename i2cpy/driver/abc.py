@@ -1,16 +1,20 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import List, TypeVar
+from struct import Struct
+from typing import TYPE_CHECKING, Callable, Dict, List, Sequence, Tuple, TypeVar
 
-try:
-    from collections.abc import Buffer
-except ImportError:
+if TYPE_CHECKING:
     from typing_extensions import Buffer
 
 from ..errors import I2CMemoryAddressSizeError
 
 
+# Address bytes for all 7-bit addresses, for write and for read.
+_ADDR_W = tuple(bytes((a << 1,)) for a in range(0x80))
+_ADDR_R = tuple(bytes((a << 1 | 1,)) for a in range(0x80))
+
+
 def i2c_addr_byte(addr: int | Buffer, is_read: bool = False) -> bytes:
     """Convert 7-bit I2C peripheral address to bytes.
 
@@ -18,6 +22,9 @@ def i2c_addr_byte(addr: int | Buffer, is_read: bool = False) -> bytes:
     :param is_read: True for read
     :return: 1-byte `bytes` that can be written to I2C bus
     """
+    if type(addr) is int and 0 <= addr <= 0x7F:
+        return _ADDR_R[addr] if is_read else _ADDR_W[addr]
+
     if isinstance(addr, int):
         addr = addr << 1
     else:
@@ -26,20 +33,56 @@ def i2c_addr_byte(addr: int | Buffer, is_read: bool = False) -> bytes:
     if is_read:
         addr |= 1
 
-    return addr.to_bytes(1)
+    return addr.to_bytes(1, "big")
 
 
-def to_buffer(x: Buffer | List[int] | int) -> Buffer:
-    """Convert input data to `Buffer` (`bytes`).
+def to_buffer(x: Buffer | List[int] | int) -> bytes | bytearray | memoryview:
+    """Convert input data to `bytes`, `bytearray` or `memoryview`.
 
     :param x: input data
-    :return: x if x is `Buffer`, otherwise `bytes` converted from x
+    :return: x if x is exactly `bytes`, `bytearray` or `memoryview`; `bytes`
+        converted from x if x is a list of ints or an int; otherwise a
+        `memoryview` of x, such as for `array.array` or `bytes` subclasses
     """
-    if isinstance(x, Buffer):
+    # Checked by exact type, which is much cheaper than isinstance() against
+    # the Buffer ABC, and which mypy narrows on.
+    if type(x) is bytes or type(x) is bytearray or type(x) is memoryview:
         return x
     if isinstance(x, list):
         return bytes(x)
-    return bytes([x])
+    if isinstance(x, int):
+        return bytes([x])
+    # Any other object supporting the buffer protocol, or TypeError.
+    return memoryview(x)
+
+
+def _pack24(memaddr: int) -> bytes:
+    # struct has no 3-byte integer format.
+    return memaddr.to_bytes(3, "big")
+
+
+def _pack_addr24(addr_byte: int, memaddr: int) -> bytes:
+    return (addr_byte << 24 | memaddr).to_bytes(4, "big")
+
+
+# struct format of each supported memory address size but 24 bits, which
+# struct has no format for.
+_MEMADDR_CODES = {8: "B", 16: "H", 32: "I"}
+
+# Address mask and big-endian packing function for each supported memory
+# address size. Precompiled Struct.pack is a bit faster than int.to_bytes().
+_MEMADDR_FORMATS: Dict[int, Tuple[int, Callable[[int], bytes]]] = {
+    size: ((1 << size) - 1, Struct(">" + code).pack)
+    for size, code in _MEMADDR_CODES.items()
+}
+_MEMADDR_FORMATS[24] = (0xFFFFFF, _pack24)
+
+# Same, but packing the address byte in front of the memory address.
+_ADDR_MEMADDR_FORMATS: Dict[int, Tuple[int, Callable[[int, int], bytes]]] = {
+    size: ((1 << size) - 1, Struct(">B" + code).pack)
+    for size, code in _MEMADDR_CODES.items()
+}
+_ADDR_MEMADDR_FORMATS[24] = (0xFFFFFF, _pack_addr24)
 
 
 def memaddr_to_bytes(memaddr: int, addrsize: int = 8) -> bytes:
@@ -49,14 +92,37 @@ def memaddr_to_bytes(memaddr: int, addrsize: int = 8) -> bytes:
     :param addrsize: must be one of 8, 16, 24, 32. Default is 8.
     :return: memory address in `bytes`
     """
-    if addrsize & 0x7 != 0 or addrsize > 32 or addrsize < 8:
+    fmt = _MEMADDR_FORMATS.get(addrsize)
+    if fmt is None:
+        raise I2CMemoryAddressSizeError(addrsize)
+    mask, pack = fmt
+    return pack(memaddr & mask)
+
+
+def addr_memaddr_to_bytes(addr: int | Buffer, memaddr: int, addrsize: int = 8) -> bytes:
+    """Convert 7-bit I2C peripheral address (for write) followed by memory
+    address to `bytes`, in one step. Same as
+    ``i2c_addr_byte(addr) + memaddr_to_bytes(memaddr, addrsize)``.
+
+    :param addr: 7-bit peripheral address
+    :param memaddr: memory address in integer.
+    :param addrsize: must be one of 8, 16, 24, 32. Default is 8.
+    :return: address byte and memory address in `bytes`
+    """
+    fmt = _ADDR_MEMADDR_FORMATS.get(addrsize)
+    if fmt is None:
         raise I2CMemoryAddressSizeError(addrsize)
-    return bytes(
-        to_buffer([(memaddr >> i) & 0xFF for i in range(addrsize - 8, -1, -8)])
-    )
+    if type(addr) is not int or not 0 <= addr <= 0x7F:
+        # Left to i2c_addr_byte() to convert, or to reject.
+        return i2c_addr_byte(addr) + memaddr_to_bytes(memaddr, addrsize)
+    mask, pack = fmt
+    return pack(addr << 1, memaddr & mask)
 
 
 class I2CDriverBase(ABC):
+    # Lets drivers define __slots__. Drivers without them still get a __dict__.
+    __slots__ = ()
+
     @abstractmethod
     def __init__(
         self,
@@ -92,12 +158,12 @@ class I2CDriverBase(ABC):
         return bytes(buf)
 
     @abstractmethod
-    def readfrom_into(self, addr: int, buf: bytearray):
+    def readfrom_into(self, addr: int, buf: Buffer):
         """Read into buf from the peripheral specified by addr.
         The number of bytes read will be the length of buf.
 
         :param addr: I2C peripheral device address
-        :param buf: buffer to store the bytes read
+        :param buf: writable buffer to store the bytes read
         """
 
     @abstractmethod
@@ -108,12 +174,66 @@ class I2CDriverBase(ABC):
         :param buf: bytes to write
         """
 
+    def writevto(self, addr: int, vector: Sequence[Buffer]):
+        """Write the bytes contained in vector to the peripheral specified by
+        addr, in a single transaction.
+
+        Drivers that can send the address byte and the buffers without first
+        joining them should override this.
+
+        :param addr: I2C peripheral device address
+        :param vector: a sequence of buffers to write
+        """
+        self.writeto(addr, b"".join(vector))
+
+    def writeto_then_readfrom(self, addr: int, out_buf: Buffer, in_buf: Buffer):
+        """Write the bytes from out_buf to the peripheral specified by addr,
+        then read into in_buf from it. The number of bytes read will be the
+        length of in_buf.
+
+        This default does a write and a read in separate transactions. Drivers
+        that can do both in one transaction, with a repeated START in between,
+        should override this.
+
+        :param addr: I2C peripheral device address
+        :param out_buf: bytes to write
+        :param in_buf: writable buffer to store the bytes read
+        """
+        self.writeto(addr, out_buf)
+        self.readfrom_into(addr, in_buf)
+
+    def exchange_batch(self, ops: Sequence[Tuple[int, Buffer, int]]) -> List[bytes]:
+        """Run a batch of operations, in order. Each operation is a tuple
+        (addr, wbuf, nread): write wbuf to the peripheral at addr if wbuf is
+        not empty, then read nread bytes from it if nread is not 0.
+
+        Drivers that can send several operations in one USB transaction should
+        override this. Such drivers may not report a peripheral that does not
+        acknowledge: its writes are then lost silently, and its reads return
+        filler bytes (0xFF) instead of raising.
+
+        :param ops: operations to run
+        :return: a list of the same length as ops, with the bytes read by each
+            operation.
+        """
+        results: List[bytes] = []
+        for addr, wbuf, nread in ops:
+            buf = bytearray(nread)
+            if nread and len(memoryview(wbuf)):
+                self.writeto_then_readfrom(addr, wbuf, buf)
+            elif nread:
+                self.readfrom_into(addr, buf)
+            else:
+                self.writeto(addr, wbuf)
+            results.append(bytes(buf))
+        return results
+
     @abstractmethod
     def readfrom_mem_into(
         self,
         addr: int,
         memaddr: int,
-        buf: bytearray,
+        buf: Buffer,
         *,
         addrsize: int = 8,
     ):
@@ -130,5 +250,16 @@ class I2CDriverBase(ABC):
         :return: True if device responds.
         """
 
+    def check_devices(self, addrs: Sequence[int]) -> List[bool]:
+        """Checks if I2C peripheral devices exist at given addresses.
+
+        Drivers that can probe several addresses in one USB transaction should
+        override this.
+
+        :param addrs: I2C peripheral device addresses
+        :return: a list of the same length as addrs, True where a device responds.
+        """
+        return [self.check_device(a) for a in addrs]
+
 
 I2CDriver = TypeVar("I2CDriver", bound=I2CDriverBase)
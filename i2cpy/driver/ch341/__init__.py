@@ -1,31 +1,31 @@
 from __future__ import annotations
 
 import sys
-from ctypes import c_byte, c_int32, c_ulong, c_uint8, create_string_buffer
-from enum import Enum
-from typing import List, Optional, Type
+from bisect import bisect_right
+from ctypes import c_byte, c_char, c_ubyte, c_ulong, c_uint8
+from enum import IntEnum
+from typing import TYPE_CHECKING, List, Optional, Sequence, Tuple, Type
 
-try:
-    from collections.abc import Buffer
-except ImportError:
+if TYPE_CHECKING:
     from typing_extensions import Buffer
 
-from .dll import ch341dll
+from .dll import ch341dll, has_chip_version
 from .constants import (
     mCH341_PACKET_LENGTH,
     mCH341A_CMD_I2C_STREAM,
     mCH341A_CMD_I2C_STM_STA,
     mCH341A_CMD_I2C_STM_STO,
     mCH341A_CMD_I2C_STM_OUT,
+    mCH341A_CMD_I2C_STM_IN,
     mCH341A_CMD_I2C_STM_MAX,
     mCH341A_CMD_I2C_STM_END,
 )
 
-from ..abc import I2CDriverBase, i2c_addr_byte, to_buffer, memaddr_to_bytes
+from ..abc import I2CDriverBase, addr_memaddr_to_bytes, i2c_addr_byte, to_buffer
 from ...errors import I2COperationFailedError
 
 
-class BaudRate(Enum):
+class BaudRate(IntEnum):
     BAUD20K = 0
     BAUD100K = 1
     BAUD400K = 2
@@ -33,160 +33,306 @@ class BaudRate(Enum):
 
     @classmethod
     def from_number(cls, freq: int | float) -> BaudRate:
-        if freq >= 750e3:
-            return BaudRate.BAUD750K
-        if freq >= 400e3:
-            return BaudRate.BAUD400K
-        if freq >= 100e3:
-            return BaudRate.BAUD100K
-        return BaudRate.BAUD20K
+        return cls(bisect_right(_BAUDRATE_THRESHOLDS, freq))
+
+
+# Lowest frequency selecting each BaudRate above BAUD20K.
+_BAUDRATE_THRESHOLDS = (100e3, 400e3, 750e3)
+
+
+# Room for commands in a command packet, besides the leading STREAM and the
+# trailing END bytes.
+_PACKET_PAYLOAD = mCH341_PACKET_LENGTH - 2
+
+# Each probe takes 4 bytes (START, OUT, address, STOP).
+_PROBES_PER_PACKET = _PACKET_PAYLOAD // 4
+
+# Probe sequence for each address byte.
+_PROBE_CMDS = tuple(
+    bytes(
+        (
+            mCH341A_CMD_I2C_STM_STA,
+            mCH341A_CMD_I2C_STM_OUT,
+            addr_byte,
+            mCH341A_CMD_I2C_STM_STO,
+        )
+    )
+    for addr_byte in range(0x100)
+)
+
+# ctypes array types for short reads, so that they are not looked up again
+# on every call.
+_BYTE_ARRAYS = {n: c_byte * n for n in range(1, mCH341_PACKET_LENGTH + 1)}
+_PACKET_BUFFER = c_ubyte * mCH341_PACKET_LENGTH
+_SCRATCH_BUFFER = c_char * mCH341_PACKET_LENGTH
+_UINT8_1 = c_uint8 * 1
+
+_IS_WIN = sys.platform == "win32"
 
 
 class CH341(I2CDriverBase):
+    __slots__ = (
+        "_fd",
+        "device_path",
+        "baudrate",
+        "_ibuf",
+        "_iolen",
+        "_scratch",
+        "_stream_i2c",
+        "_write_data",
+        "_write_read",
+    )
+
+    _DEFAULT_DEVICE_PATH = "/dev/ch34x_pis0"
+
     def __init__(self, id: Optional[int | str] = None, *, freq: int | float = 400000):
         """Initializes the CH341 I2C driver.
 
-        :param id: CH341 device index number, defaults to 0 on Windows and
-            /etc/ch34x_pis0 on posix systems.
+        :param id: CH341 device index number, defaults to 0. On posix systems
+            it can also be a device path, and an index number `n` maps to
+            /dev/ch34x_pis`n`.
         :param freq: I2C bus baudrate, defaults to 400000
         :param dll: CH341 DLL name
         """
-        if id is None:
-            if sys.platform == "win32":
-                id = 0
-            else:
-                id = "/dev/ch34x_pis0"
-
-        if sys.platform == "win32":
-            self._fd = id
+        if _IS_WIN:
+            self._fd = 0 if id is None else id
         else:
-            self.device_path = id
+            if id is None or id == 0:
+                self.device_path = self._DEFAULT_DEVICE_PATH
+            elif isinstance(id, int):
+                self.device_path = "/dev/ch34x_pis{}".format(id)
+            else:
+                self.device_path = id
             self._fd = -1
         self.baudrate = BaudRate.from_number(freq)
 
-    def init(self):
-        """Initialize the I2C bus."""
-        if sys.platform == "win32":
-            self._init_nt()
-        else:
-            self._init_posix()
+        # Reply buffer and length reused by the probes. The length is passed
+        # as a bare c_ulong, which ctypes passes by reference for the
+        # POINTER(c_ulong) parameter.
+        self._ibuf = _PACKET_BUFFER()
+        self._iolen = c_ulong()
+        # Scratch buffer for short reads.
+        self._scratch = _SCRATCH_BUFFER()
+
+        # Bind the functions used on the transfer paths once, so that each
+        # call is a single instance attribute lookup.
+        self._stream_i2c = ch341dll.CH341StreamI2C
+        self._write_data = ch341dll.CH341WriteData
+        self._write_read = ch341dll.CH341WriteRead
 
     def _init_nt(self):
+        """Initialize the I2C bus."""
         if ch341dll.CH341OpenDevice(self._fd) != -1:
-            ret = ch341dll.CH341SetStream(self._fd, self.baudrate.value)
-            self._check_ret(ret, "CH341SetStream")
+            ret = ch341dll.CH341SetStream(self._fd, self.baudrate)
+            _check_ret(ret, "CH341SetStream")
         else:
             raise I2COperationFailedError("CH341OpenDevice")
 
     def _init_posix(self):
-        buf = create_string_buffer(b"/dev/ch34x_pis0")
-        fd = ch341dll.CH341OpenDevice(buf)
+        """Initialize the I2C bus."""
+        # CH341OpenDevice is declared to take c_char_p, so bytes go straight in.
+        path = self.device_path
+        fd = ch341dll.CH341OpenDevice(
+            path if isinstance(path, bytes) else path.encode()
+        )
         if fd > 0:
             self._fd = fd
 
             # Must call this api. Without it later api calls like CH34xSetStream() won't work.
-            chip_ver = (c_uint8 * 1)()
-            ret = ch341dll.CH34x_GetChipVersion(self._fd, chip_ver)
+            if has_chip_version:
+                chip_ver = _UINT8_1()
+                ch341dll.CH34x_GetChipVersion(self._fd, chip_ver)
 
-            ch341dll.CH34xSetStream.argtypes = (c_int32, c_uint8)
-            ret = ch341dll.CH34xSetStream(self._fd, self.baudrate.value)
-            self._check_ret(ret, "CH34xSetStream")
+            ret = ch341dll.CH34xSetStream(self._fd, self.baudrate)
+            _check_ret(ret, "CH34xSetStream")
         else:
             raise OSError("CH341OpenDevice(%s) failed!" % self.device_path)
 
+    init = _init_nt if _IS_WIN else _init_posix
+
     def deinit(self):
         """Close the I2C bus."""
         ret = ch341dll.CH341CloseDevice(self._fd)
-        self._check_ret(ret, "CH341CloseDevice")
-
-    def _writeread_into(self, buf: Buffer, rbuf: Optional[bytearray]):
-        try:
-            ibuf = (c_byte * len(memoryview(buf))).from_buffer(buf)
-        except TypeError:
-            # When buf is bytes, above gets "TypeError: underlying buffer is not writable".
-            # In this case we retry with from_buffer_copy()
-            ibuf = (c_byte * len(memoryview(buf))).from_buffer_copy(buf)
+        _check_ret(ret, "CH341CloseDevice")
 
+    def _writeread_into(self, buf: bytes, rbuf: Optional[Buffer]):
+        # The write buffer is declared as c_void_p, which takes bytes as is.
+        n = len(buf)
         if rbuf is None:
-            nbytes = 0
-            obuf = None
-        else:
+            ret = self._stream_i2c(self._fd, n, buf, 0, None)
+        elif type(rbuf) is bytearray and len(rbuf) <= mCH341_PACKET_LENGTH:
+            # Reading a short reply into the scratch buffer and copying it out
+            # is cheaper than wrapping rbuf in a new ctypes array.
             nbytes = len(rbuf)
-            obuf = (c_byte * nbytes).from_buffer(rbuf)
-        ret = ch341dll.CH341StreamI2C(self._fd, len(ibuf), ibuf, nbytes, obuf)
-        self._check_ret(ret, "CH341StreamI2C")
+            scratch = self._scratch
+            ret = self._stream_i2c(self._fd, n, buf, nbytes, scratch)
+            if ret:
+                # Slicing a c_char array gives bytes.
+                rbuf[:] = scratch[:nbytes]  # type: ignore[assignment]
+        else:
+            if type(rbuf) is bytearray:
+                nbytes = len(rbuf)
+            else:
+                # len() of e.g. a numpy array counts items, not bytes.
+                nbytes = memoryview(rbuf).nbytes
+            obuf = (_BYTE_ARRAYS.get(nbytes) or c_byte * nbytes).from_buffer(rbuf)
+            ret = self._stream_i2c(self._fd, n, buf, nbytes, obuf)
+        if not ret:
+            raise I2COperationFailedError("CH341StreamI2C")
 
-    def _write(self, buf: Buffer):
+    def _write(self, buf: bytes):
         self._writeread_into(buf, None)
 
-    def readfrom_into(self, addr: int, buf: bytearray):
+    def readfrom_into(self, addr: int, buf: Buffer):
         wbuf = i2c_addr_byte(addr)
         self._writeread_into(wbuf, buf)
 
     def writeto(self, addr: int, buf: Buffer | List[int]):
-        wbuf = bytes(i2c_addr_byte(addr)) + to_buffer(buf)
+        # One bytes object, which ctypes passes on without another copy.
+        wbuf = b"".join((i2c_addr_byte(addr), to_buffer(buf)))
         self._write(wbuf)
 
+    def writevto(self, addr: int, vector: Sequence[Buffer]):
+        wbuf = b"".join((i2c_addr_byte(addr), *vector))
+        self._write(wbuf)
+
+    def writeto_then_readfrom(self, addr: int, out_buf: Buffer, in_buf: Buffer):
+        wbuf = b"".join((i2c_addr_byte(addr), to_buffer(out_buf)))
+        self._writeread_into(wbuf, in_buf)
+
     def readfrom_mem_into(
         self,
         addr: int,
         memaddr: int,
-        buf: bytearray,
+        buf: Buffer,
         *,
         addrsize: int = 8,
     ):
-        wbuf = bytes(i2c_addr_byte(addr)) + memaddr_to_bytes(memaddr, addrsize)
-        self._writeread_into(wbuf, buf)
+        self._writeread_into(addr_memaddr_to_bytes(addr, memaddr, addrsize), buf)
+
+    def exchange_batch(self, ops: Sequence[Tuple[int, Buffer, int]]) -> List[bytes]:
+        results: List[bytes] = []
+        cmd = bytearray()
+        nreads: List[int] = []
+        for addr, wbuf, nread in ops:
+            op = _stream_op(addr, bytes(wbuf), nread)
+            if len(op) > _PACKET_PAYLOAD or nread > mCH341A_CMD_I2C_STM_MAX:
+                # Too long for a command packet, do it on its own.
+                results += self._run_stream(cmd, nreads)
+                cmd.clear()
+                nreads.clear()
+                results += super().exchange_batch(((addr, wbuf, nread),))
+                continue
+            if (
+                len(cmd) + len(op) > _PACKET_PAYLOAD
+                or sum(nreads) + nread > mCH341A_CMD_I2C_STM_MAX
+            ):
+                results += self._run_stream(cmd, nreads)
+                cmd.clear()
+                nreads.clear()
+            cmd += op
+            nreads.append(nread)
+        results += self._run_stream(cmd, nreads)
+        return results
 
-    def _start(self):
-        """Generate a START condition on the bus
-        (SDA transitions to low while SCL is high).
+    def _run_stream(self, cmd: bytearray, nreads: List[int]) -> List[bytes]:
+        """Send the batched operations in cmd as one command packet, and split
+        the bytes read by the lengths in nreads.
         """
-        buf = (c_byte * 3)(
-            mCH341A_CMD_I2C_STREAM, mCH341A_CMD_I2C_STM_STA, mCH341A_CMD_I2C_STM_END
+        if not nreads:
+            return []
+        packet = bytearray((mCH341A_CMD_I2C_STREAM,))
+        packet += cmd
+        packet.append(mCH341A_CMD_I2C_STM_END)
+        buf = bytes(packet)
+
+        nreply = sum(nreads)
+        ilen = self._iolen
+        if nreply == 0:
+            ilen.value = len(packet)
+            ret = self._write_data(self._fd, buf, ilen)
+            if not ret:
+                raise I2COperationFailedError("CH341WriteData")
+            return [b""] * len(nreads)
+
+        ibuf = self._ibuf
+        ilen.value = 0
+        ret = self._write_read(
+            self._fd, len(buf), buf, mCH341A_CMD_I2C_STM_MAX, 1, ilen, ibuf
         )
-        iolength = (c_ulong * 1)(len(buf))
-        ret = ch341dll.CH341WriteData(self._fd, buf, iolength)
-        self._check_ret(ret, "CH341WriteData")
+        if not ret:
+            raise I2COperationFailedError("CH341WriteRead")
+        if ilen.value != nreply:
+            raise I2COperationFailedError("CH341WriteRead")
+
+        data = bytes(ibuf)
+        results = []
+        start = 0
+        for n in nreads:
+            results.append(data[start : start + n])
+            start += n
+        return results
 
-    def _stop(self):
-        """Generate a STOP condition on the bus
-        (SDA transitions to high while SCL is high).
+    def check_device(self, addr: int | Buffer) -> bool:
+        return self._probe((addr,))[0]
+
+    def check_devices(self, addrs: Sequence[int]) -> List[bool]:
+        acks: List[bool] = []
+        for i in range(0, len(addrs), _PROBES_PER_PACKET):
+            acks.extend(self._probe(addrs[i : i + _PROBES_PER_PACKET]))
+        return acks
+
+    def _probe(self, addrs: Sequence[int | Buffer]) -> List[bool]:
+        """Probe up to `_PROBES_PER_PACKET` addresses in one command packet.
+        Each address is sent in its own START/address/STOP sequence, and the
+        chip returns one status byte per address.
         """
-        buf = (c_byte * 3)(
-            mCH341A_CMD_I2C_STREAM, mCH341A_CMD_I2C_STM_STO, mCH341A_CMD_I2C_STM_END
-        )
-        iolength = (c_ulong * 1)(len(buf))
-        ret = ch341dll.CH341WriteData(self._fd, buf, iolength)
-        self._check_ret(ret, "CH341WriteData")
+        cmd = bytearray((mCH341A_CMD_I2C_STREAM,))
+        for addr in addrs:
+            cmd += _PROBE_CMDS[i2c_addr_byte(addr)[0]]
+        cmd.append(mCH341A_CMD_I2C_STM_END)
 
-    def _out_byte_check_ack(self, obyte: int) -> bool:
-        buf = (c_byte * 4)(
-            mCH341A_CMD_I2C_STREAM,
-            mCH341A_CMD_I2C_STM_OUT,
-            obyte,
-            mCH341A_CMD_I2C_STM_END,
-        )
-        ibuf = (c_byte * mCH341_PACKET_LENGTH)()
-        ilen = (c_ulong * 1)(0)
-        ret = ch341dll.CH341WriteRead(
+        buf = bytes(cmd)
+        ibuf = self._ibuf
+        ilen = self._iolen
+        ilen.value = 0
+        ret = self._write_read(
             self._fd, len(buf), buf, mCH341A_CMD_I2C_STM_MAX, 1, ilen, ibuf
         )
-        self._check_ret(ret, "CH341WriteRead")
-        return ilen[0] > 0 and ibuf[ilen[0] - 1] & 0x80 == 0
+        if not ret:
+            raise I2COperationFailedError("CH341WriteRead")
+        nreply = ilen.value
+        return [i < nreply and ibuf[i] & 0x80 == 0 for i in range(len(addrs))]
 
-    def check_device(self, addr: int | Buffer) -> bool:
-        self._start()
-        try:
-            obyte = i2c_addr_byte(addr)[0]
-            return self._out_byte_check_ack(obyte)
-        finally:
-            self._stop()
 
-    @classmethod
-    def _check_ret(cls, result: int, operation: str):
-        if not result:
-            raise I2COperationFailedError(operation)
+def _check_ret(result: int, operation: str):
+    if not result:
+        raise I2COperationFailedError(operation)
+
+
+def _stream_op(addr: int, wbuf: bytes, nread: int) -> bytearray:
+    """Stream commands for one operation of a batch: write wbuf unless it is
+    empty, then read nread bytes with a repeated START unless nread is 0, and
+    finally STOP. An operation with neither only sends the address.
+    """
+    cmd = bytearray()
+    if wbuf or not nread:
+        cmd += bytes(
+            (mCH341A_CMD_I2C_STM_STA, mCH341A_CMD_I2C_STM_OUT | (1 + len(wbuf)))
+        )
+        cmd.append(addr << 1)
+        cmd += wbuf
+    if nread:
+        cmd += bytes(
+            (mCH341A_CMD_I2C_STM_STA, mCH341A_CMD_I2C_STM_OUT | 1, addr << 1 | 1)
+        )
+        if nread > 1:
+            # Acknowledge all bytes but the last one, which IN with length 0
+            # reads with a NACK.
+            cmd.append(mCH341A_CMD_I2C_STM_IN | (nread - 1))
+        cmd.append(mCH341A_CMD_I2C_STM_IN)
+    cmd.append(mCH341A_CMD_I2C_STM_STO)
+    return cmd
 
 
 def driver_class() -> Type[I2CDriverBase]:
@@ -1,11 +1,49 @@
 import sys
 import os
-import re
+from ctypes import POINTER, c_int, c_int32, c_uint8, c_ulong, c_void_p
 
 if sys.platform == "win32":
     from ctypes import windll, CDLL
 else:
-    from ctypes import cdll, CDLL, c_char_p, c_int32, c_uint8
+    from ctypes import cdll, CDLL, c_char_p
+
+
+# Device handle: the device index on Windows, a file descriptor on posix.
+_DEVICE = c_ulong if sys.platform == "win32" else c_int32
+
+
+# CH341 functions, and the CH34x names libch347.so may export them under.
+_POSIX_ALIASES = (
+    ("CH341OpenDevice", "CH34xOpenDevice"),
+    ("CH341CloseDevice", "CH34xCloseDevice"),
+    ("CH341SetStream", "CH34xSetStream"),
+    ("CH341StreamI2C", "CH34xStreamI2C"),
+    ("CH341WriteData", "CH34xWriteData"),
+    ("CH341WriteRead", "CH34xWriteRead"),
+)
+
+
+def _declare_prototypes(dll: CDLL):
+    """Declare argument and result types of the functions used by the driver.
+    Without them ctypes has to guess the conversion of every argument on
+    every call.
+    """
+    dll.CH341CloseDevice.argtypes = (_DEVICE,)
+    dll.CH341CloseDevice.restype = c_int
+    dll.CH341StreamI2C.argtypes = (_DEVICE, c_ulong, c_void_p, c_ulong, c_void_p)
+    dll.CH341StreamI2C.restype = c_int
+    dll.CH341WriteData.argtypes = (_DEVICE, c_void_p, POINTER(c_ulong))
+    dll.CH341WriteData.restype = c_int
+    dll.CH341WriteRead.argtypes = (
+        _DEVICE,
+        c_ulong,
+        c_void_p,
+        c_ulong,
+        c_ulong,
+        POINTER(c_ulong),
+        c_void_p,
+    )
+    dll.CH341WriteRead.restype = c_int
 
 
 def load() -> CDLL:
@@ -16,32 +54,39 @@ def load() -> CDLL:
         else:
             dll_name = "libch347.so"
 
+    # Load with windll/cdll, not pydll: their functions release the GIL for
+    # the duration of each call, so other threads, including ones driving
+    # another adapter, keep running while a USB transfer blocks.
     if sys.platform == "win32":
-        return windll.LoadLibrary(dll_name)
+        dll = windll.LoadLibrary(dll_name)
+
+        dll.CH341OpenDevice.argtypes = (c_ulong,)
+        dll.CH341SetStream.argtypes = (c_ulong, c_ulong)
     else:
         dll = cdll.LoadLibrary(dll_name)
 
-        funcs = [
-            "CH341OpenDevice",
-            "CH341CloseDevice",
-            "CH341SetStream",
-            "CH341StreamI2C",
-            "CH341WriteData",
-            "CH341WriteRead",
-        ]
-
-        for fname in funcs:
+        for fname, alias in _POSIX_ALIASES:
             if not getattr(dll, fname, None):
-                fname2 = re.sub(r"^CH341", "CH34x", fname)
-                f = getattr(dll, fname2)
-                setattr(dll, fname, f)
+                setattr(dll, fname, getattr(dll, alias))
 
         dll.CH34xOpenDevice.argtypes = (c_char_p,)
         dll.CH341OpenDevice.argtypes = (c_char_p,)
         dll.CH34xSetStream.argtypes = (c_int32, c_uint8)
         dll.CH341SetStream.argtypes = (c_int32, c_uint8)
 
-        return dll
+    dll.CH341OpenDevice.restype = c_int
+    dll.CH341SetStream.restype = c_int
+    _declare_prototypes(dll)
+
+    return dll
 
 
 ch341dll = load()
+
+# Whether the library has CH34x_GetChipVersion, looked up once. Its prototype
+# is only declared when present, so that loading does not fail on a library
+# without it.
+has_chip_version = bool(getattr(ch341dll, "CH34x_GetChipVersion", None))
+if has_chip_version:
+    ch341dll.CH34x_GetChipVersion.argtypes = (c_int32, POINTER(c_uint8))
+    ch341dll.CH34x_GetChipVersion.restype = c_int
@@ -0,0 +1,157 @@
+# Tests of the CH341 command packets, with the DLL transfer functions
+# replaced by fakes. Only needs the DLL to be loadable, not a device.
+
+import sys
+
+import pytest
+
+try:
+    from i2cpy.driver.ch341 import CH341
+except OSError as exc:
+    pytest.skip("CH341 DLL not available: {}".format(exc), allow_module_level=True)
+from i2cpy.errors import *
+
+
+class FakeDLL:
+    """Records the commands sent. WriteRead answers with the reply lengths in
+    `replies` in turn, replying bytes counting up from 1.
+    """
+
+    def __init__(self, ret: int = 1, replies=()):
+        self.ret = ret
+        self.replies = list(replies)
+        self.write_data = []
+        self.write_read = []
+        self.stream_i2c = []
+
+    def WriteData(self, fd, buf, ilen):
+        self.write_data.append(bytes(buf)[: ilen.value])
+        return self.ret
+
+    def WriteRead(self, fd, wlen, buf, rmax, ntimes, ilen, ibuf):
+        self.write_read.append(bytes(buf)[:wlen])
+        nreply = self.replies.pop(0)
+        for i in range(nreply):
+            ibuf[i] = i + 1
+        ilen.value = nreply
+        return self.ret
+
+    def StreamI2C(self, fd, wlen, wbuf, rlen, rbuf):
+        self.stream_i2c.append((bytes(wbuf)[:wlen], rlen))
+        return self.ret
+
+
+def make_driver(fake: FakeDLL) -> CH341:
+    driver = CH341()
+    driver._write_data = fake.WriteData
+    driver._write_read = fake.WriteRead
+    driver._stream_i2c = fake.StreamI2C
+    return driver
+
+
+def test_exchange_batch_packet():
+    fake = FakeDLL(replies=[2])
+    driver = make_driver(fake)
+
+    got = driver.exchange_batch([(0x50, b"\x10", 2), (0x17, b"\xaa\xbb", 0)])
+
+    assert got == [b"\x01\x02", b""]
+    assert fake.write_read == [
+        bytes(
+            [0xAA]
+            + [0x74, 0x82, 0xA0, 0x10, 0x74, 0x81, 0xA1, 0xC1, 0xC0, 0x75]
+            + [0x74, 0x83, 0x2E, 0xAA, 0xBB, 0x75]
+            + [0x00]
+        )
+    ]
+    assert fake.write_data == []
+
+
+def test_exchange_batch_write_only():
+    fake = FakeDLL()
+    driver = make_driver(fake)
+
+    # A 26-byte write exactly fills the 30 bytes of commands in a packet.
+    data = bytes(range(26))
+    got = driver.exchange_batch([(0x50, data, 0), (0x50, b"\x01", 0)])
+
+    assert got == [b"", b""]
+    assert fake.write_data == [
+        b"\xaa\x74\x9b\xa0" + data + b"\x75\x00",
+        b"\xaa\x74\x82\xa0\x01\x75\x00",
+    ]
+    assert fake.write_read == []
+    assert fake.stream_i2c == []
+
+
+def test_exchange_batch_read_max():
+    fake = FakeDLL(replies=[32, 1])
+    driver = make_driver(fake)
+
+    # Reads of 32 bytes fill the reply of a packet each.
+    got = driver.exchange_batch([(0x50, b"", 32), (0x50, b"", 1)])
+
+    assert got == [bytes(range(1, 33)), b"\x01"]
+    assert fake.write_read == [
+        b"\xaa\x74\x81\xa1\xdf\xc0\x75\x00",
+        b"\xaa\x74\x81\xa1\xc0\x75\x00",
+    ]
+
+
+def test_exchange_batch_oversize():
+    fake = FakeDLL()
+    driver = make_driver(fake)
+
+    # Too long for a packet, so sent on its own between the batched ones.
+    data = bytes(range(27))
+    got = driver.exchange_batch(
+        [(0x50, b"\x01", 0), (0x50, data, 0), (0x50, b"\x02", 0)]
+    )
+
+    assert got == [b"", b"", b""]
+    assert fake.write_data == [
+        b"\xaa\x74\x82\xa0\x01\x75\x00",
+        b"\xaa\x74\x82\xa0\x02\x75\x00",
+    ]
+    assert fake.stream_i2c == [(b"\xa0" + data, 0)]
+
+
+def test_exchange_batch_oversize_error():
+    fake = FakeDLL(ret=0)
+    driver = make_driver(fake)
+
+    with pytest.raises(I2COperationFailedError):
+        driver.exchange_batch([(0x50, b"", 33)])
+    # CH341StreamI2C takes the address for write, and reads after it.
+    assert fake.stream_i2c == [(b"\xa0", 33)]
+
+
+def test_exchange_batch_reply_length_error():
+    fake = FakeDLL(replies=[1])
+    driver = make_driver(fake)
+
+    with pytest.raises(I2COperationFailedError):
+        driver.exchange_batch([(0x50, b"\x10", 2)])
+
+
+def test_exchange_batch_error():
+    fake = FakeDLL(ret=0)
+    driver = make_driver(fake)
+
+    with pytest.raises(I2COperationFailedError):
+        driver.exchange_batch([(0x50, b"\x10", 0)])
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="device paths are posix only")
+@pytest.mark.parametrize(
+    "id,expected",
+    [
+        (None, "/dev/ch34x_pis0"),
+        (0, "/dev/ch34x_pis0"),
+        (3, "/dev/ch34x_pis3"),
+        ("/dev/x", "/dev/x"),
+        (b"/dev/x", b"/dev/x"),
+    ],
+)
+def test_device_path(id, expected):
+    assert CH341(id).device_path == expected
@@ -3,6 +3,7 @@
 import pytest
 
 import os
+import time
 from i2cpy import I2C
 from i2cpy.errors import *
 
@@ -15,6 +16,30 @@ def test_driver():
         i2c = I2C(driver="somethingbad")
 
 
+def test_driver_init_failure(monkeypatch):
+    import i2cpy
+    from types import SimpleNamespace
+
+    inits = []
+
+    class FailingDriver:
+        def __init__(self, **kwargs):
+            pass
+
+        def init(self):
+            inits.append(self)
+            raise OSError("open failed")
+
+    module = SimpleNamespace(driver_class=lambda: FailingDriver)
+    monkeypatch.setitem(i2cpy._DRIVER_CACHE, "failing", module)
+
+    i2c = I2C(driver="failing")
+    for _ in range(2):
+        with pytest.raises(OSError):
+            i2c.readfrom(addr, 2)
+    assert len(inits) == 2
+
+
 def test_scan():
     i2c = I2C()
     assert i2c.scan() == [addr]
@@ -52,3 +77,40 @@ def test_i2c_user_wrapper_funcs():
     for data in ([0x55, 0xAA, 0xAA, 0x55], [0x00, 0x00, 0x00, 0x00]):
         i2c_write(addr, memaddr, *data)
         assert i2c_read(addr, memaddr, 4) == data
+
+
+def test_i2c_writeto_then_readfrom():
+    i2c = I2C(freq=100e3)
+
+    memaddr = 0x30
+    data = b"\x12\x34\x56\x78"
+    i2c.writeto_mem(addr, memaddr, data)
+
+    buf = bytearray(len(data))
+    i2c.writeto_then_readfrom(addr, bytes([memaddr]), buf)
+    assert buf == data
+
+
+def test_i2c_readfrom_mem_into_numpy():
+    np = pytest.importorskip("numpy")
+
+    i2c = I2C(freq=100e3)
+
+    memaddr = 0x10
+    data = b"\x55\xaa\x55\xaa"
+    i2c.writeto_mem(addr, memaddr, data)
+
+    buf = np.zeros(2, dtype=np.uint16)
+    i2c.readfrom_mem_into(addr, memaddr, buf)
+    assert buf.tobytes() == data
+
+
+def test_i2c_exchange_batch():
+    i2c = I2C(freq=100e3)
+
+    data = b"\x01\x02\x03\x04"
+    assert i2c.exchange_batch([(addr, b"\x40" + data, 0)]) == [b""]
+    # Wait out the memory's write cycle, during which it does not acknowledge.
+    time.sleep(0.01)
+    got = i2c.exchange_batch([(addr, b"\x40", len(data)), (addr, b"\x42", 2)])
+    assert got == [data, data[2:]]
@@ -1,6 +1,13 @@
+import array
+
 import pytest
 
-from i2cpy.driver.abc import to_buffer, memaddr_to_bytes
+from i2cpy.driver.abc import (
+    to_buffer,
+    i2c_addr_byte,
+    memaddr_to_bytes,
+    addr_memaddr_to_bytes,
+)
 from i2cpy.errors import *
 
 
@@ -30,3 +37,55 @@ def test_memaddr_to_bytes_error(addrsize):
 )
 def test_memaddr_to_bytes_error(memaddr, addrsize, expected):
     assert memaddr_to_bytes(memaddr, addrsize) == expected
+
+
+@pytest.mark.parametrize(
+    "addr,memaddr,addrsize,expected",
+    [
+        (0x17, 0x2A, 8, b"\x2e\x2a"),
+        (0x17, 0xC52A, 8, b"\x2e\x2a"),
+        (0x50, 0xC52A, 16, b"\xa0\xc5\x2a"),
+        (0x50, 0x7B3EC52A, 24, b"\xa0\x3e\xc5\x2a"),
+        (0x7F, 0x7B3EC52A, 32, b"\xfe\x7b\x3e\xc5\x2a"),
+    ],
+)
+def test_addr_memaddr_to_bytes(addr, memaddr, addrsize, expected):
+    assert addr_memaddr_to_bytes(addr, memaddr, addrsize) == expected
+
+
+def test_addr_memaddr_to_bytes_error():
+    with pytest.raises(I2CMemoryAddressSizeError):
+        addr_memaddr_to_bytes(0x17, 0x10, 12)
+
+
+@pytest.mark.parametrize("addrsize", [8, 16, 24, 32])
+@pytest.mark.parametrize("addr", [0x80, 0xFF, -1])
+def test_addr_memaddr_to_bytes_addr_error(addr, addrsize):
+    with pytest.raises(OverflowError):
+        addr_memaddr_to_bytes(addr, 0x10, addrsize)
+
+
+@pytest.mark.parametrize("addrsize", [8, 16, 24, 32])
+def test_addr_memaddr_to_bytes_buffer_addr(addrsize):
+    expected = i2c_addr_byte(0x50) + memaddr_to_bytes(0x10, addrsize)
+    assert addr_memaddr_to_bytes(b"\x50", 0x10, addrsize) == expected
+
+
+@pytest.mark.parametrize(
+    "x",
+    [b"\x55\xaa", bytearray(b"\x55\xaa"), memoryview(b"\x55\xaa")],
+)
+def test_to_buffer_passthrough(x):
+    assert to_buffer(x) is x
+
+
+@pytest.mark.parametrize(
+    "x,expected",
+    [
+        ([0x55, 0xAA], b"\x55\xaa"),
+        (0x55, b"\x55"),
+        (array.array("B", [0x55, 0xAA]), b"\x55\xaa"),
+    ],
+)
+def test_to_buffer(x, expected):
+    assert bytes(to_buffer(x)) == expected